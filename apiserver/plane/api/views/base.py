@@ -51,6 +51,12 @@ class WebhookMixin:
             self.webhook_event
             and self.request.method in ["POST", "PATCH", "DELETE"]
             and response.status_code in [200, 201, 204]
+            # Bulk writes that changed nothing have no issues to report
+            and not (
+                self.bulk
+                and self.request.method in ["POST", "PATCH"]
+                and not response.data
+            )
         ):
             url = request.build_absolute_uri()
             parsed_url = urlparse(url)
@@ -2,9 +2,9 @@
 import json
 
 # Django imports
+from django.db import transaction
 from django.db.models import Count, Prefetch, Q, F, Func, OuterRef
 from django.utils import timezone
-from django.core import serializers
 
 # Third party imports
 from rest_framework import status
@@ -55,9 +55,7 @@ class ModuleAPIEndpoint(WebhookMixin, BaseAPIView):
             .prefetch_related(
                 Prefetch(
                     "link_module",
-                    queryset=ModuleLink.objects.select_related(
-                        "module", "created_by"
-                    ),
+                    queryset=ModuleLink.objects.select_related("created_by"),
                 )
             )
             .annotate(
@@ -129,7 +127,9 @@ class ModuleAPIEndpoint(WebhookMixin, BaseAPIView):
         )
 
     def post(self, request, slug, project_id):
-        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+        project = Project.objects.only("id", "workspace").get(
+            pk=project_id, workspace__slug=slug
+        )
         serializer = ModuleSerializer(
             data=request.data,
             context={
@@ -275,34 +275,6 @@ class ModuleIssueAPIEndpoint(WebhookMixin, BaseAPIView):
         ProjectEntityPermission,
     ]
 
-    def get_queryset(self):
-        return (
-            ModuleIssue.objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(
-                    parent=OuterRef("issue")
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .filter(workspace__slug=self.kwargs.get("slug"))
-            .filter(project_id=self.kwargs.get("project_id"))
-            .filter(module_id=self.kwargs.get("module_id"))
-            .filter(
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
-            )
-            .filter(project__archived_at__isnull=True)
-            .select_related("project")
-            .select_related("workspace")
-            .select_related("module")
-            .select_related("issue", "issue__state", "issue__project")
-            .prefetch_related("issue__assignees", "issue__labels")
-            .prefetch_related("module__members")
-            .order_by(self.kwargs.get("order_by", "-created_at"))
-            .distinct()
-        )
-
     def get(self, request, slug, project_id, module_id):
         order_by = request.GET.get("order_by", "created_at")
         issues = (
@@ -358,82 +330,97 @@ class ModuleIssueAPIEndpoint(WebhookMixin, BaseAPIView):
                 {"error": "Issues are required"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        module = Module.objects.get(
-            workspace__slug=slug, project_id=project_id, pk=module_id
-        )
-
-        issues = Issue.objects.filter(
-            workspace__slug=slug, project_id=project_id, pk__in=issues
-        ).values_list("id", flat=True)
-
-        module_issues = list(ModuleIssue.objects.filter(issue_id__in=issues))
+        with transaction.atomic():
+            # Lock the module row so concurrent requests on the same module
+            # compute and write their links one at a time
+            module = Module.objects.select_for_update(of=("self",)).get(
+                workspace__slug=slug, project_id=project_id, pk=module_id
+            )
 
-        update_module_issue_activity = []
-        records_to_update = []
-        record_to_create = []
+            # Resolve the requested ids once, dropping duplicates and unknowns
+            issues = list(
+                Issue.objects.filter(
+                    workspace__slug=slug,
+                    project_id=project_id,
+                    pk__in={str(issue) for issue in issues},
+                ).values_list("id", flat=True)
+            )
 
-        for issue in issues:
-            module_issue = [
-                module_issue
-                for module_issue in module_issues
-                if str(module_issue.issue_id) in issues
-            ]
+            # An issue can belong to several modules, so only links to this
+            # module count as existing; links elsewhere are left in place
+            existing_issue_ids = set(
+                ModuleIssue.objects.filter(
+                    workspace__slug=slug,
+                    project_id=project_id,
+                    module_id=module_id,
+                    issue_id__in=issues,
+                ).values_list("issue_id", flat=True)
+            )
 
-            if len(module_issue):
-                if module_issue[0].module_id != module_id:
-                    update_module_issue_activity.append(
-                        {
-                            "old_module_id": str(module_issue[0].module_id),
-                            "new_module_id": str(module_id),
-                            "issue_id": str(module_issue[0].issue_id),
-                        }
-                    )
-                    module_issue[0].module_id = module_id
-                    records_to_update.append(module_issue[0])
-            else:
-                record_to_create.append(
-                    ModuleIssue(
-                        module=module,
-                        issue_id=issue,
-                        project_id=project_id,
-                        workspace=module.workspace,
-                        created_by=request.user,
-                        updated_by=request.user,
-                    )
+            record_to_create = [
+                ModuleIssue(
+                    module=module,
+                    issue_id=issue,
+                    project_id=project_id,
+                    workspace_id=module.workspace_id,
+                    created_by=request.user,
+                    updated_by=request.user,
                 )
+                for issue in issues
+                if issue not in existing_issue_ids
+            ]
 
-        ModuleIssue.objects.bulk_create(
-            record_to_create,
-            batch_size=10,
-            ignore_conflicts=True,
-        )
+            # Nothing to write when every issue already belongs to this module
+            if not record_to_create:
+                return Response(status=status.HTTP_204_NO_CONTENT)
 
-        ModuleIssue.objects.bulk_update(
-            records_to_update,
-            ["module"],
-            batch_size=10,
-        )
+            # Links already in this module were filtered out under the lock,
+            # so every row is inserted and keeps the id generated for it
+            module_issues = ModuleIssue.objects.bulk_create(
+                record_to_create,
+                batch_size=1000,
+            )
 
         # Capture Issue Activity
         issue_activity.delay(
             type="module.activity.created",
-            requested_data=json.dumps({"modules_list": str(issues)}),
+            requested_data=json.dumps(
+                {"modules_list": [str(issue) for issue in issues]}
+            ),
             actor_id=str(self.request.user.id),
             issue_id=None,
             project_id=str(self.kwargs.get("project_id", None)),
             current_instance=json.dumps(
                 {
-                    "updated_module_issues": update_module_issue_activity,
-                    "created_module_issues": serializers.serialize(
-                        "json", record_to_create
-                    ),
+                    "created_module_issue_ids": [
+                        str(module_issue.issue_id)
+                        for module_issue in record_to_create
+                    ],
                 }
             ),
             epoch=int(timezone.now().timestamp()),
         )
 
+        # Respond with the written rows instead of selecting them again
+        touched_issue_ids = [
+            module_issue.issue_id for module_issue in module_issues
+        ]
+
+        # Count the sub issues of every touched issue in one grouped query
+        sub_issues_count = dict(
+            Issue.issue_objects.filter(parent_id__in=touched_issue_ids)
+            .order_by()
+            .values("parent_id")
+            .annotate(count=Count("id"))
+            .values_list("parent_id", "count")
+        )
+        for module_issue in module_issues:
+            module_issue.sub_issues_count = sub_issues_count.get(
+                module_issue.issue_id, 0
+            )
+
         return Response(
-            ModuleIssueSerializer(self.get_queryset(), many=True).data,
+            ModuleIssueSerializer(module_issues, many=True).data,
             status=status.HTTP_200_OK,
         )
 
@@ -480,9 +467,7 @@ class ModuleArchiveUnarchiveAPIEndpoint(BaseAPIView):
             .prefetch_related(
                 Prefetch(
                     "link_module",
-                    queryset=ModuleLink.objects.select_related(
-                        "module", "created_by"
-                    ),
+                    queryset=ModuleLink.objects.select_related("created_by"),
                 )
             )
             .annotate(
@@ -140,9 +140,7 @@ class ModuleViewSet(WebhookMixin, BaseViewSet):
             .prefetch_related(
                 Prefetch(
                     "link_module",
-                    queryset=ModuleLink.objects.select_related(
-                        "module", "created_by"
-                    ),
+                    queryset=ModuleLink.objects.select_related("created_by"),
                 )
             )
             .annotate(
@@ -195,7 +193,13 @@ class ModuleViewSet(WebhookMixin, BaseViewSet):
         )
 
     def create(self, request, slug, project_id):
-        project = Project.objects.get(workspace__slug=slug, pk=project_id)
+        # The serializer and ProjectBaseModel.save only read the project and
+        # workspace keys, so load just those ids in a single query
+        project = (
+            Project.objects.select_related("workspace")
+            .only("id", "workspace__id")
+            .get(workspace__slug=slug, pk=project_id)
+        )
         serializer = ModuleWriteSerializer(
             data=request.data, context={"project": project}
         )
@@ -539,9 +543,7 @@ class ModuleArchiveUnarchiveEndpoint(BaseAPIView):
             .prefetch_related(
                 Prefetch(
                     "link_module",
-                    queryset=ModuleLink.objects.select_related(
-                        "module", "created_by"
-                    ),
+                    queryset=ModuleLink.objects.select_related("created_by"),
                 )
             )
             .annotate(
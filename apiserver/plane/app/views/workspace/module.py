@@ -33,9 +33,7 @@ class WorkspaceModulesEndpoint(BaseAPIView):
             .prefetch_related(
                 Prefetch(
                     "link_module",
-                    queryset=ModuleLink.objects.select_related(
-                        "module", "created_by"
-                    ),
+                    queryset=ModuleLink.objects.select_related("created_by"),
                 )
             )
             .annotate(
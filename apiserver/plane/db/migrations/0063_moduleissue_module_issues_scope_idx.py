@@ -0,0 +1,20 @@
+# Generated by Django 4.2.11 on 2026-10-15 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0062_cycle_archived_at_module_archived_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="moduleissue",
+            index=models.Index(
+                fields=["workspace", "project", "module", "issue"],
+                name="module_issues_scope_idx",
+            ),
+        ),
+    ]
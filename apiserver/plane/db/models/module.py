@@ -141,6 +141,12 @@ class ModuleIssue(ProjectBaseModel):
 
     class Meta:
         unique_together = ["issue", "module"]
+        indexes = [
+            models.Index(
+                fields=["workspace", "project", "module", "issue"],
+                name="module_issues_scope_idx",
+            ),
+        ]
         verbose_name = "Module Issue"
         verbose_name_plural = "Module Issues"
         db_table = "module_issues"
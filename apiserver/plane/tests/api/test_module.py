@@ -0,0 +1,180 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.test import override_settings
+
+# Third party imports
+from rest_framework import status
+
+# Module imports
+from plane.db.models import (
+    APIToken,
+    Issue,
+    Module,
+    ModuleIssue,
+    Project,
+    ProjectMember,
+    User,
+    Workspace,
+)
+from .base import BaseAPITest
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache"
+        }
+    }
+)
+@mock.patch("plane.api.views.base.send_webhook")
+@mock.patch("plane.api.views.module.issue_activity")
+class ModuleIssueAPITest(BaseAPITest):
+    def setUp(self):
+        super().setUp()
+
+        self.user = User.objects.create(email="user@plane.so")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        ProjectMember.objects.create(
+            project=self.project, member=self.user, role=20
+        )
+        api_token = APIToken.objects.create(
+            user=self.user, workspace=self.workspace
+        )
+        self.client.credentials(HTTP_X_API_KEY=api_token.token)
+
+        self.module = Module.objects.create(
+            name="Module", project=self.project
+        )
+        self.other_module = Module.objects.create(
+            name="Other Module", project=self.project
+        )
+        self.issues = [
+            Issue.objects.create(name=f"Issue {index}", project=self.project)
+            for index in range(2)
+        ]
+
+    def module_issue_url(self, module):
+        return (
+            f"/api/v1/workspaces/{self.workspace.slug}"
+            f"/projects/{self.project.id}"
+            f"/modules/{module.id}/module-issues/"
+        )
+
+    def link(self, module, issue):
+        return ModuleIssue.objects.create(
+            module=module, issue=issue, project=self.project
+        )
+
+    def test_add_issues_to_empty_module(self, issue_activity, send_webhook):
+        response = self.client.post(
+            self.module_issue_url(self.module),
+            {"issues": [str(issue.id) for issue in self.issues]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(
+                ModuleIssue.objects.filter(module=self.module).values_list(
+                    "issue_id", flat=True
+                )
+            ),
+            {issue.id for issue in self.issues},
+        )
+        issue_activity.delay.assert_called_once()
+        send_webhook.delay.assert_called_once()
+
+    def test_re_add_existing_issue_is_a_no_op(
+        self, issue_activity, send_webhook
+    ):
+        self.link(self.module, self.issues[0])
+
+        response = self.client.post(
+            self.module_issue_url(self.module),
+            {"issues": [str(self.issues[0].id)]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(
+            ModuleIssue.objects.filter(module=self.module).count(), 1
+        )
+        issue_activity.delay.assert_not_called()
+        send_webhook.delay.assert_not_called()
+
+    def test_issue_in_other_module_is_added_not_moved(
+        self, issue_activity, send_webhook
+    ):
+        self.link(self.other_module, self.issues[0])
+
+        response = self.client.post(
+            self.module_issue_url(self.module),
+            {"issues": [str(self.issues[0].id)]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(
+                ModuleIssue.objects.filter(issue=self.issues[0]).values_list(
+                    "module_id", flat=True
+                )
+            ),
+            {self.module.id, self.other_module.id},
+        )
+
+    def test_issue_in_this_and_other_module(
+        self, issue_activity, send_webhook
+    ):
+        self.link(self.other_module, self.issues[0])
+        self.link(self.module, self.issues[0])
+
+        response = self.client.post(
+            self.module_issue_url(self.module),
+            {"issues": [str(issue.id) for issue in self.issues]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["issue"] for item in response.data],
+            [self.issues[1].id],
+        )
+        self.assertEqual(
+            ModuleIssue.objects.filter(issue=self.issues[0]).count(), 2
+        )
+
+    def test_response_lists_only_created_module_issues(
+        self, issue_activity, send_webhook
+    ):
+        self.link(self.module, self.issues[0])
+        Issue.objects.create(
+            name="Sub Issue", project=self.project, parent=self.issues[1]
+        )
+
+        response = self.client.post(
+            self.module_issue_url(self.module),
+            {"issues": [str(issue.id) for issue in self.issues]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+
+        module_issue = ModuleIssue.objects.get(
+            module=self.module, issue=self.issues[1]
+        )
+        data = response.data[0]
+        self.assertEqual(data["id"], module_issue.id)
+        self.assertEqual(data["issue"], self.issues[1].id)
+        self.assertEqual(data["module"], self.module.id)
+        self.assertEqual(data["project"], self.project.id)
+        self.assertEqual(data["workspace"], self.workspace.id)
+        self.assertEqual(data["sub_issues_count"], 1)